@@ -148,9 +148,11 @@ async def setup():
     server_url = "https://chat.bioimage.io"
     token = await login({"server_url": server_url})
     server = await connect_to_server({"server_url": server_url, "token": token})
-    svc = await server.register_service(chatbot_extension)
-
-    await datastore.setup(server, service_id="data-store")
+    # Register the extension and the data store concurrently to cut startup latency
+    svc, _ = await asyncio.gather(
+        server.register_service(chatbot_extension),
+        datastore.setup(server, service_id="data-store"),
+    )
 
     print(f"Extension service registered with id: {svc.id}, you can visit the service at:\n https://bioimage.io/chat?server={server_url}&extension={svc.id}&assistant=Skyler")
 
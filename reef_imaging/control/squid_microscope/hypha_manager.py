@@ -35,9 +35,10 @@ class HyphaManager:
                 ), f"The authorized users file is not found at {authorized_users_path}"
                 with open(authorized_users_path, "r") as f:
                     authorized_users = json.load(f)["users"]
-                self.authorized_emails = [
+                # A set makes the email membership test in check_permission O(1)
+                self.authorized_emails = {
                     user["email"] for user in authorized_users if "email" in user
-                ]
+                }
             else:
                 self.authorized_emails = None
         else:
@@ -222,7 +223,7 @@ class HyphaManager:
 
     def one_new_frame(self, context=None):
         gray_img = self.squidController.camera.read_frame()
-        bgr_img = np.stack((gray_img,)*3, axis=-1)  # Duplicate grayscale data across 3 channels to simulate BGR format.
+        bgr_img = cv2.cvtColor(gray_img, cv2.COLOR_GRAY2BGR)  # Duplicate grayscale data across 3 channels to get a BGR image.
         return bgr_img
 
 
@@ -251,16 +252,12 @@ class HyphaManager:
             time.sleep(0.005)
         self.squidController.liveController.turn_off_illumination()
         # gray_img=np.resize(gray_img,(512,512))
-        # Rescale the image to span the full 0-255 range
-        min_val = np.min(gray_img)
-        max_val = np.max(gray_img)
-        if max_val > min_val:  # Avoid division by zero if the image is completely uniform
-            gray_img = (gray_img - min_val) * (255 / (max_val - min_val))
-            gray_img = gray_img.astype(np.uint8)  # Convert to 8-bit image
-        else:
-            gray_img = np.zeros((512, 512), dtype=np.uint8)  # If no variation, return a black image
+        # Downsample to the preview size first so the rescaling below only touches the small image
+        gray_img = cv2.resize(gray_img, (1006, 795), interpolation=cv2.INTER_AREA)
+        # Rescale the image to span the full 0-255 range, directly into an 8-bit image
+        # (a completely uniform image comes out black)
+        gray_img = cv2.normalize(gray_img, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
 
-        gray_img = cv2.resize(gray_img, (1006, 795))
         _, png_image = cv2.imencode('.png', gray_img)  # Encode directly in grayscale
 
         # Store the PNG image
@@ -1,6 +1,7 @@
 
 # Initialize chatpt vision
 from openai import AsyncOpenAI
+import asyncio
 import base64
 import httpx
 from PIL import Image
@@ -8,17 +9,26 @@ from io import BytesIO
 import matplotlib.pyplot as plt
 
 
+# Shared client so repeated calls reuse the same connection pool
+aclient = None
 
 
 async def aask(images, messages, max_tokens=1024):
-    aclient = AsyncOpenAI()
+    global aclient
+    if aclient is None:
+        aclient = AsyncOpenAI()
     user_message = []
-    # download the images and save it into a list of PIL image objects
+    # download the images concurrently over one client, then load them as PIL image objects
+    # wait for every download before closing the client, and raise the first failure below
+    async with httpx.AsyncClient() as client:
+        responses = await asyncio.gather(
+            *(client.get(image.url) for image in images), return_exceptions=True
+        )
     img_objs = []
-    for image in images:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(image.url)
-            response.raise_for_status()
+    for image, response in zip(images, responses):
+        if isinstance(response, BaseException):
+            raise response
+        response.raise_for_status()
         try:
             img = Image.open(BytesIO(response.content))
         except Exception as e:
@@ -17,9 +17,10 @@ class AuthenticatedUser:
                 ), f"The authorized users file is not found at {authorized_users_path}"
                 with open(authorized_users_path, "r") as f:
                     authorized_users = json.load(f)["users"]
-                authorized_emails = [
+                # A set makes the email membership test in check_permission O(1)
+                authorized_emails = {
                     user["email"] for user in authorized_users if "email" in user
-                ]
+                }
             else:
                 authorized_emails = None
         else:
@@ -10,6 +10,7 @@ class HyphaDataStore:
         self.storage = {}
         self._svc = None
         self._server = None
+        self._base_url = None
 
     async def setup(self, server, service_id="data-store", visibility="public"):
         self._server = server
@@ -22,11 +23,13 @@ class HyphaDataStore:
             },
             "get": self.http_get,
         }, overwrite=True)
+        # The URL prefix is fixed once the service is registered
+        self._base_url = f"{server.config.public_base_url}/{server.config.workspace}/apps/{self._svc.id.split(':')[1]}/get"
 
     def get_url(self, obj_id: str):
         assert self._svc, "Service not initialized, call `setup()`"
         assert obj_id in self.storage, "Object not found " + obj_id
-        return f"{self._server.config.public_base_url}/{self._server.config.workspace}/apps/{self._svc.id.split(':')[1]}/get?id={obj_id}"
+        return f"{self._base_url}?id={obj_id}"
 
     def put(self, obj_type: str, value: any, name: str, comment: str = ""):
         assert self._svc, "Please call `setup()` before using the store"
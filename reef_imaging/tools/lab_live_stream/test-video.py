@@ -1,5 +1,6 @@
 import os
 import cv2
+import asyncio
 import time
 import logging
 import uvicorn
@@ -49,7 +50,12 @@ def index(request: Request):
 @app.get('/video_feed')
 async def video_feed(request: Request):
     async def generator():
-        for frame in gen_frames():
+        frames = gen_frames()
+        while True:
+            # Capture, encode and throttle in a worker thread so the event loop stays free
+            frame = await asyncio.to_thread(next, frames, None)
+            if frame is None:
+                break
             # Check if the client is still connected
             if await request.is_disconnected():
                 logging.info("Client disconnected, stopping the generator")